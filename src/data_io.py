@@ -0,0 +1,73 @@
+# src/data_io.py
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import os
+import logging
+from typing import Dict, List, Optional
+
+PARQUET_SUFFIX = '.parquet'
+# Parquet schema metadata key recording which columns were parsed as dates
+PARSE_DATES_KEY = b'read_csv_cached.parse_dates'
+
+
+def _parse_dates_tag(parse_dates: Optional[List[str]]) -> bytes:
+    return ','.join(sorted(parse_dates or [])).encode()
+
+
+def _read_cache(
+    cache_path: str,
+    parse_dates: Optional[List[str]],
+    usecols: Optional[List[str]]
+) -> Optional[pd.DataFrame]:
+    """
+    Return the cached frame if it was parsed with the same date columns and holds
+    every requested column, otherwise None.
+    """
+    schema = pq.read_schema(cache_path)
+    if (schema.metadata or {}).get(PARSE_DATES_KEY) != _parse_dates_tag(parse_dates):
+        return None
+    if usecols is not None and not set(usecols) <= set(schema.names):
+        return None
+    return pd.read_parquet(cache_path, columns=usecols)
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str, parse_dates: Optional[List[str]]) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[PARSE_DATES_KEY] = _parse_dates_tag(parse_dates)
+    pq.write_table(table.replace_schema_metadata(metadata), cache_path)
+
+
+def read_csv_cached(
+    path: str,
+    parse_dates: Optional[List[str]] = None,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Read a CSV file with the pyarrow engine (falling back to the C engine when a date
+    column does not parse), caching the parsed frame as Parquet.
+    The Parquet copy (path + '.parquet') is used on later calls as long as it is
+    not older than the CSV, was parsed with the same parse_dates and holds every
+    requested column; otherwise the CSV is re-parsed and the cache rewritten.
+    The cache stores the parse before dtype is applied, so callers asking for
+    different dtypes never see each other's casts.
+    """
+    cache_path = path + PARQUET_SUFFIX
+    df = None
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        df = _read_cache(cache_path, parse_dates, usecols)
+    
+    if df is None:
+        df = pd.read_csv(path, engine='pyarrow', parse_dates=parse_dates, usecols=usecols)
+        if any(not pd.api.types.is_datetime64_any_dtype(df[col]) for col in parse_dates or []):
+            # pyarrow leaves date columns with blank cells as strings; the C engine parses them to NaT
+            df = pd.read_csv(path, parse_dates=parse_dates, usecols=usecols)
+        try:
+            _write_cache(df, cache_path, parse_dates)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logging.warning(f"Could not cache {path} as Parquet: {e}")
+    
+    return df.astype(dtype) if dtype else df
@@ -2,17 +2,92 @@
 
 import pandas as pd
 import numpy as np
-from textblob import TextBlob
+import nltk
 import matplotlib.pyplot as plt
-import seaborn as sns
+from scipy.stats import gaussian_kde
 import os
+import re
 import logging
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Tuple, Optional
 
+from src.data_io import read_csv_cached
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# Tokens looked up in the sentiment lexicon (lowercased words, keeping apostrophes)
+TOKEN_PATTERN = re.compile(r"[a-z']+")
+# VADER normalization constant used to squash summed valences into [-1, 1]
+VADER_ALPHA = 15.0
+# Exchange timezone used to decide which calendar day a news timestamp falls on
+MARKET_TIMEZONE = 'America/New_York'
+# Columns read from the news and stock CSVs
+NEWS_COLUMNS = ['date', 'headline', 'publisher']
+STOCK_COLUMNS = ['Date', 'Close']
+# Plotting limits for visualize_results
+MAX_SCATTER_POINTS = 5000
+KDE_GRID_POINTS = 200
+MAX_KDE_POINTS = 5000
+
+
+@lru_cache(maxsize=None)
+def load_sentiment_lexicon() -> dict:
+    """
+    Load the VADER word -> valence lexicon shipped with NLTK, downloading it on first use.
+    """
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+    try:
+        analyzer = SentimentIntensityAnalyzer()
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+        analyzer = SentimentIntensityAnalyzer()
+    return analyzer.lexicon
+
+
+def score_headlines(headlines: pd.Series) -> np.ndarray:
+    """
+    Score headlines with a lexicon lookup over their tokens.
+    Returns VADER-normalized polarity scores in [-1, 1] as a float32 array.
+    Valences are summed as-is: VADER's negation, booster, capitalization and
+    punctuation rules are not applied, so e.g. "not good" scores positive.
+    """
+    lexicon = load_sentiment_lexicon()
+    lookup = lexicon.get
+    tokenize = TOKEN_PATTERN.findall
+    
+    # Tokenize and score each headline in one pass, straight into a float32 array
+    scores = np.fromiter(
+        (sum([lookup(word, 0.0) for word in tokenize(str(text).lower())]) for text in headlines.to_numpy()),
+        dtype=np.float32,
+        count=len(headlines)
+    )
+    return scores / np.sqrt(scores * scores + VADER_ALPHA)
+
+
+def plot_histogram(ax, values: np.ndarray, bins: int = 30) -> None:
+    """
+    Draw a precomputed histogram of values on ax with a Gaussian KDE overlay
+    evaluated on a fixed grid and scaled to the bin counts. The KDE is fit on at
+    most MAX_KDE_POINTS values.
+    """
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    widths = np.diff(edges)
+    ax.bar(edges[:-1], counts, width=widths, align='edge', alpha=0.6, edgecolor='white')
+    ax.set_ylabel('Count')
+    
+    if values.size > 1 and np.ptp(values) > 0:
+        # Fit on a bounded sample so evaluation costs at most KDE_GRID_POINTS * MAX_KDE_POINTS kernels
+        kde_values = values
+        if values.size > MAX_KDE_POINTS:
+            kde_values = np.random.default_rng(0).choice(values, MAX_KDE_POINTS, replace=False)
+        kde = gaussian_kde(kde_values)
+        grid = np.linspace(values.min(), values.max(), KDE_GRID_POINTS)
+        ax.plot(grid, kde(grid) * values.size * widths[0])
+
+
 class NewsStockCorrelation:
     """
     A class to analyze correlation between financial news sentiment and stock price movements.
@@ -28,26 +103,35 @@ class NewsStockCorrelation:
         self.news_df = pd.DataFrame()
         self.stock_df = pd.DataFrame()
         self.merged_df = pd.DataFrame()
+        self._trading_days = np.array([], dtype='datetime64[D]')
         
     def load_data(self) -> bool:
         """
-        Load and validate news and stock data.
-        Returns True if successful, False otherwise.
+        Load news and stock data, reading only the required columns.
+        Returns True if successful, False otherwise (e.g. a required column is missing).
         """
         try:
-            # Load news data
-            self.news_df = pd.read_csv(self.news_path, parse_dates=['date'])
-            required_news_cols = ['date', 'headline', 'publisher']
-            if not all(col in self.news_df.columns for col in required_news_cols):
-                logging.error(f"News data missing required columns. Needed: {required_news_cols}")
-                return False
+            # Load news data (only the columns the analysis uses)
+            self.news_df = read_csv_cached(
+                self.news_path,
+                parse_dates=['date'],
+                usecols=NEWS_COLUMNS,
+                dtype={'headline': 'string', 'publisher': 'category'}
+            )
             
             # Load stock data
-            self.stock_df = pd.read_csv(self.stock_path, parse_dates=['Date'])
-            required_stock_cols = ['Date', 'Close']
-            if not all(col in self.stock_df.columns for col in required_stock_cols):
-                logging.error(f"Stock data missing required columns. Needed: {required_stock_cols}")
-                return False
+            self.stock_df = read_csv_cached(
+                self.stock_path,
+                parse_dates=['Date'],
+                usecols=STOCK_COLUMNS,
+                dtype={'Close': 'float32'}
+            )
+            
+            # Day-resolution join key, computed once as datetime64 instead of Python date objects
+            stock_days = self.stock_df['Date'].to_numpy().astype('datetime64[D]')
+            self.stock_df['date_only'] = stock_days
+            # Sorted unique trading days: the shared axis for align_dates and calculate_daily_metrics
+            self._trading_days = np.unique(stock_days[~np.isnat(stock_days)])
                 
             return True
             
@@ -59,151 +143,181 @@ class NewsStockCorrelation:
         """
         Align news dates with trading days by adjusting news dates to the next trading day
         if they occur on non-trading days (weekends/holidays).
+        News published after the last available trading day is left unaligned (NaT).
         """
-        try:
-            # Ensure we have trading days
-            trading_days = self.stock_df['Date'].dt.date.unique()
-            
-            def adjust_to_trading_day(date):
-                date = date.date()
-                while date not in trading_days:
-                    date += timedelta(days=1)
-                return date
-                
-            self.news_df['aligned_date'] = self.news_df['date'].apply(adjust_to_trading_day)
-            logging.info("Date alignment completed successfully.")
-            
-        except Exception as e:
-            logging.error(f"Error in date alignment: {e}")
-            raise
+        trading_days = self._trading_days
+        
+        news_dates = self.news_df['date']
+        if not pd.api.types.is_datetime64_any_dtype(news_dates):
+            news_dates = pd.to_datetime(news_dates, utc=True)
+        if news_dates.dt.tz is not None:
+            # Use the exchange's calendar day, whatever offset the timestamps were parsed with
+            news_dates = news_dates.dt.tz_convert(MARKET_TIMEZONE).dt.tz_localize(None)
+        news_days = news_dates.to_numpy().astype('datetime64[D]')
+        
+        # First trading day on or after each news date, by binary search over the sorted days
+        idx = np.searchsorted(trading_days, news_days, side='left')
+        idx[idx == len(trading_days)] = -1
+        
+        # The searchsorted positions are already category codes, so no re-hashing is needed
+        self.news_df['aligned_date'] = pd.Categorical.from_codes(
+            idx, categories=pd.DatetimeIndex(trading_days)
+        )
+        logging.info("Date alignment completed successfully.")
     
-    def analyze_sentiment(self) -> None:
+    def analyze_sentiment(self, n_jobs: Optional[int] = 1) -> None:
         """
-        Perform sentiment analysis on news headlines using TextBlob.
+        Perform sentiment analysis on news headlines using the VADER lexicon.
+        With n_jobs > 1 (or None for all cores) headlines are scored in parallel chunks.
         """
-        try:
-            def get_sentiment(text):
-                analysis = TextBlob(str(text))
-                return analysis.sentiment.polarity
-                
-            self.news_df['sentiment'] = self.news_df['headline'].apply(get_sentiment)
-            logging.info("Sentiment analysis completed.")
-            
-        except Exception as e:
-            logging.error(f"Error in sentiment analysis: {e}")
-            raise
+        headlines = self.news_df['headline']
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        
+        if n_jobs > 1 and len(headlines) > n_jobs:
+            # Fetch the lexicon here so workers never race to download it
+            load_sentiment_lexicon()
+            bounds = np.linspace(0, len(headlines), n_jobs + 1, dtype=int)
+            chunks = [headlines.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                scores = np.concatenate(list(executor.map(score_headlines, chunks)))
+        else:
+            scores = score_headlines(headlines)
+        
+        self.news_df['sentiment'] = scores
+        logging.info("Sentiment analysis completed.")
     
     def calculate_daily_metrics(self) -> None:
         """
         Calculate daily average sentiment and stock returns.
         """
-        try:
-            # Calculate daily average sentiment
-            daily_sentiment = self.news_df.groupby('aligned_date')['sentiment'].agg(['mean', 'count'])
-            daily_sentiment.columns = ['avg_sentiment', 'news_count']
-            
-            # Calculate daily stock returns
-            self.stock_df['daily_return'] = self.stock_df['Close'].pct_change() * 100
-            self.stock_df['date_only'] = self.stock_df['Date'].dt.date
-            
-            # Merge the data
-            self.merged_df = pd.merge(
-                daily_sentiment,
-                self.stock_df[['date_only', 'daily_return', 'Close']],
-                left_index=True,
-                right_on='date_only',
-                how='inner'
-            )
-            
-            # Drop rows with NaN returns (first day)
-            self.merged_df.dropna(subset=['daily_return'], inplace=True)
-            logging.info("Daily metrics calculation completed.")
-            
-        except Exception as e:
-            logging.error(f"Error calculating daily metrics: {e}")
-            raise
+        # Calculate daily average sentiment (group keys left unsorted; order comes from the stock side)
+        daily_sentiment = self.news_df.groupby('aligned_date', sort=False, observed=True).agg(
+            avg_sentiment=('sentiment', 'mean'),
+            news_count=('sentiment', 'size')
+        )
+        
+        # Scatter the daily values onto the trading-day axis; the category codes are trading-day positions
+        n_days = len(self._trading_days)
+        day_codes = daily_sentiment.index.codes
+        avg_sentiment = np.full(n_days, np.nan, dtype=daily_sentiment['avg_sentiment'].dtype)
+        avg_sentiment[day_codes] = daily_sentiment['avg_sentiment'].to_numpy()
+        news_count = np.zeros(n_days, dtype=np.int64)
+        news_count[day_codes] = daily_sentiment['news_count'].to_numpy()
+        
+        # Calculate daily stock returns
+        close = self.stock_df['Close'].to_numpy(dtype=np.float32)
+        daily_return = np.empty_like(close)
+        daily_return[:1] = np.nan
+        np.divide(close[1:], close[:-1], out=daily_return[1:])
+        daily_return[1:] -= 1.0
+        daily_return *= 100.0
+        self.stock_df['daily_return'] = daily_return
+        
+        # Join on the shared trading-day axis: keep stock days with news and a return (drops the first day)
+        stock_days = self.stock_df['date_only'].to_numpy()
+        day_idx = np.searchsorted(self._trading_days, stock_days.astype('datetime64[D]'))
+        # Undated stock rows (NaT) sort past the last trading day and never match
+        keep = (day_idx < n_days) & ~np.isnan(daily_return)
+        keep[keep] = news_count[day_idx[keep]] > 0
+        day_idx = day_idx[keep]
+        
+        self.merged_df = pd.DataFrame({
+            'avg_sentiment': avg_sentiment[day_idx],
+            'news_count': news_count[day_idx],
+            'date_only': stock_days[keep],
+            'daily_return': daily_return[keep],
+            'Close': self.stock_df['Close'].to_numpy()[keep]
+        }, index=self.stock_df.index[keep])
+        logging.info("Daily metrics calculation completed.")
     
     def calculate_correlation(self) -> Tuple[float, Optional[float]]:
         """
         Calculate Pearson correlation between sentiment and stock returns.
         Returns correlation coefficient and p-value.
         """
-        try:
-            from scipy.stats import pearsonr
-            corr, p_value = pearsonr(
-                self.merged_df['avg_sentiment'],
-                self.merged_df['daily_return']
-            )
-            logging.info(f"Correlation between sentiment and returns: {corr:.3f} (p-value: {p_value:.3f})")
-            return corr, p_value
-            
-        except Exception as e:
-            logging.error(f"Error calculating correlation: {e}")
-            raise
+        from scipy.stats import t as t_dist
+        x = self.merged_df['avg_sentiment'].to_numpy(dtype=np.float32, copy=True)
+        y = self.merged_df['daily_return'].to_numpy(dtype=np.float32, copy=True)
+        n = len(x)
+        if n < 2:
+            raise ValueError(f"Need at least 2 observations for correlation, got {n}")
+        
+        # Pearson r from centered dot products over float32 data, accumulated in float64
+        x -= x.mean(dtype=np.float64)
+        y -= y.mean(dtype=np.float64)
+        num = np.einsum('i,i->', x, y, dtype=np.float64)
+        den = np.sqrt(np.einsum('i,i->', x, x, dtype=np.float64) * np.einsum('i,i->', y, y, dtype=np.float64))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Constant input gives 0 / 0 = NaN, as pearsonr reports it
+            corr = float(np.clip(num / den, -1.0, 1.0))
+        
+        # Two-sided p-value from the t statistic with n - 2 degrees of freedom
+        dof = n - 2
+        if np.isnan(corr):
+            p_value = float('nan')
+        elif n == 2:
+            # Like pearsonr: two points always lie on a line, so r is exactly +/-1 with p = 1
+            corr = float(np.sign(corr))
+            p_value = 1.0
+        elif abs(corr) == 1.0:
+            p_value = 0.0
+        else:
+            t_stat = corr * np.sqrt(dof / (1.0 - corr * corr))
+            p_value = float(2 * t_dist.sf(abs(t_stat), dof))
+        logging.info(f"Correlation between sentiment and returns: {corr:.3f} (p-value: {p_value:.3f})")
+        return corr, p_value
     
     def visualize_results(self, save_path: Optional[str] = None) -> None:
         """
         Visualize the correlation analysis results.
         """
         try:
-            plt.figure(figsize=(14, 10))
+            fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+            sentiment = self.merged_df['avg_sentiment'].to_numpy()
+            returns = self.merged_df['daily_return'].to_numpy()
             
-            # Plot 1: Sentiment vs Returns Scatter
-            plt.subplot(2, 2, 1)
-            sns.regplot(
-                x='avg_sentiment',
-                y='daily_return',
-                data=self.merged_df,
-                scatter_kws={'alpha': 0.5},
-                line_kws={'color': 'red'}
-            )
-            plt.title(f'Sentiment vs Daily Returns ({self.symbol})')
-            plt.xlabel('Average Daily Sentiment Score')
-            plt.ylabel('Daily Return (%)')
+            # Plot 1: Sentiment vs Returns Scatter (subsampled) with a least-squares line
+            ax = axes[0, 0]
+            sample = self.merged_df.sample(min(MAX_SCATTER_POINTS, len(self.merged_df)), random_state=0)
+            ax.scatter(sample['avg_sentiment'], sample['daily_return'], alpha=0.5)
+            if len(sentiment) > 1:
+                slope, intercept = np.polyfit(sentiment, returns, 1)
+                line_x = np.array([sentiment.min(), sentiment.max()])
+                ax.plot(line_x, slope * line_x + intercept, color='red')
+            ax.set_title(f'Sentiment vs Daily Returns ({self.symbol})')
+            ax.set_xlabel('Average Daily Sentiment Score')
+            ax.set_ylabel('Daily Return (%)')
             
             # Plot 2: Sentiment Distribution
-            plt.subplot(2, 2, 2)
-            sns.histplot(self.news_df['sentiment'], bins=30, kde=True)
-            plt.title('Sentiment Score Distribution')
-            plt.xlabel('Sentiment Score')
+            ax = axes[0, 1]
+            plot_histogram(ax, self.news_df['sentiment'].to_numpy())
+            ax.set_title('Sentiment Score Distribution')
+            ax.set_xlabel('Sentiment Score')
             
             # Plot 3: Daily Returns Distribution
-            plt.subplot(2, 2, 3)
-            sns.histplot(self.merged_df['daily_return'], bins=30, kde=True)
-            plt.title('Daily Returns Distribution')
-            plt.xlabel('Daily Return (%)')
+            ax = axes[1, 0]
+            plot_histogram(ax, returns)
+            ax.set_title('Daily Returns Distribution')
+            ax.set_xlabel('Daily Return (%)')
             
             # Plot 4: Time Series of Sentiment and Returns
-            plt.subplot(2, 2, 4)
-            ax1 = plt.gca()
+            ax1 = axes[1, 1]
             ax2 = ax1.twinx()
-            
-            sns.lineplot(
-                x='date_only',
-                y='avg_sentiment',
-                data=self.merged_df,
-                ax=ax1,
-                color='blue',
-                label='Sentiment'
-            )
-            sns.lineplot(
-                x='date_only',
-                y='daily_return',
-                data=self.merged_df,
-                ax=ax2,
-                color='orange',
-                label='Return'
-            )
-            plt.title('Sentiment and Returns Over Time')
+            dates = self.merged_df['date_only'].to_numpy()
+            sentiment_line, = ax1.plot(dates, sentiment, color='blue', label='Sentiment')
+            return_line, = ax2.plot(dates, returns, color='orange', label='Return')
+            ax1.legend(handles=[sentiment_line, return_line])
+            ax1.set_title('Sentiment and Returns Over Time')
             ax1.set_xlabel('Date')
             ax1.set_ylabel('Sentiment Score', color='blue')
             ax2.set_ylabel('Daily Return (%)', color='orange')
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
                 os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path)
+                fig.savefig(save_path)
                 logging.info(f"Visualization saved to {save_path}")
             plt.show()
             
@@ -211,9 +325,16 @@ class NewsStockCorrelation:
             logging.error(f"Error visualizing results: {e}")
             raise
     
-    def run_analysis(self, output_dir: str = '../results') -> dict:
+    def run_analysis(
+        self,
+        output_dir: str = '../results',
+        n_jobs: Optional[int] = 1,
+        legacy_csv: bool = False
+    ) -> dict:
         """
         Run complete analysis pipeline.
+        n_jobs is passed to analyze_sentiment to score headlines in parallel.
+        The merged data is saved as Parquet, or as CSV if legacy_csv is True.
         Returns dictionary with results.
         """
         try:
@@ -223,13 +344,17 @@ class NewsStockCorrelation:
                 return {"error": "Data loading failed"}
                 
             self.align_dates()
-            self.analyze_sentiment()
+            self.analyze_sentiment(n_jobs)
             self.calculate_daily_metrics()
             corr, p_value = self.calculate_correlation()
             
-            # Save merged data
-            merged_path = os.path.join(output_dir, f"{self.symbol}_news_stock_merged.csv")
-            self.merged_df.to_csv(merged_path, index=False)
+            # Save merged data (Parquet by default, CSV when legacy_csv is set)
+            if legacy_csv:
+                merged_path = os.path.join(output_dir, f"{self.symbol}_news_stock_merged.csv")
+                self.merged_df.to_csv(merged_path, index=False)
+            else:
+                merged_path = os.path.join(output_dir, f"{self.symbol}_news_stock_merged.parquet")
+                self.merged_df.to_parquet(merged_path, compression='snappy', index=False)
             
             # Save visualization
             viz_path = os.path.join(output_dir, f"{self.symbol}_correlation_plot.png")
@@ -1,9 +1,117 @@
 # src/stock_analyzer.py
 
 import pandas as pd
-import talib
+import numpy as np
+from numba import njit
 import matplotlib.pyplot as plt
 import os
+from functools import lru_cache
+
+from src.data_io import read_csv_cached
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+SMA_PERIOD = 20
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+
+@njit(cache=True)
+def compute_indicators(close, out_sma, out_rsi, out_macd, out_signal):
+    """
+    Compute SMA, RSI and MACD/signal in a single pass over the closing prices.
+    Matches TA-Lib's seeding: RSI starts from simple averages of the first gains/losses,
+    and each EMA starts from the simple mean of the window ending at the slow EMA's first value.
+    """
+    n = close.shape[0]
+    out_sma[:] = np.nan
+    out_rsi[:] = np.nan
+    out_macd[:] = np.nan
+    out_signal[:] = np.nan
+
+    k_fast = 2.0 / (MACD_FAST + 1)
+    k_slow = 2.0 / (MACD_SLOW + 1)
+    k_signal = 2.0 / (MACD_SIGNAL + 1)
+    fast_start = MACD_SLOW - MACD_FAST
+    macd_start = MACD_SLOW - 1
+    signal_start = macd_start + MACD_SIGNAL - 1
+
+    sma_sum = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    signal = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # Simple moving average over a rolling window sum
+        sma_sum += c
+        if i >= SMA_PERIOD:
+            sma_sum -= close[i - SMA_PERIOD]
+        if i >= SMA_PERIOD - 1:
+            out_sma[i] = sma_sum / SMA_PERIOD
+
+        # RSI with Wilder smoothing
+        if i >= 1:
+            diff = c - close[i - 1]
+            # Like TA-Lib 0.4.0, a NaN change lands in the gains and the RSI stays NaN from there
+            gain = 0.0 if diff < 0.0 else diff
+            loss = -diff if diff < 0.0 else 0.0
+            if i <= RSI_PERIOD:
+                avg_gain += gain
+                avg_loss += loss
+                if i == RSI_PERIOD:
+                    avg_gain /= RSI_PERIOD
+                    avg_loss /= RSI_PERIOD
+            else:
+                avg_gain = (avg_gain * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+                avg_loss = (avg_loss * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+            if i >= RSI_PERIOD:
+                total = avg_gain + avg_loss
+                out_rsi[i] = 0.0 if -1e-8 < total < 1e-8 else 100.0 * avg_gain / total
+
+        # Fast/slow EMAs, seeded with the mean of their first windows
+        if i < macd_start:
+            ema_slow += c
+            if i >= fast_start:
+                ema_fast += c
+            continue
+        if i == macd_start:
+            ema_slow = (ema_slow + c) / MACD_SLOW
+            ema_fast = (ema_fast + c) / MACD_FAST
+        else:
+            ema_slow += k_slow * (c - ema_slow)
+            ema_fast += k_fast * (c - ema_fast)
+        macd = ema_fast - ema_slow
+
+        # Signal line: EMA of MACD, seeded with the mean of its first window
+        if i < signal_start:
+            signal += macd
+            continue
+        if i == signal_start:
+            signal = (signal + macd) / MACD_SIGNAL
+        else:
+            signal += k_signal * (macd - signal)
+        out_macd[i] = macd
+        out_signal[i] = signal
+
+
+@lru_cache(maxsize=32)
+def _cached_indicators(symbol: str, close_bytes: bytes):
+    """
+    Memoized compute_indicators keyed on the symbol and the raw float64 Close buffer,
+    so re-running an analysis on unchanged prices skips the computation.
+    """
+    close = np.frombuffer(close_bytes, dtype=np.float64)
+    outputs = tuple(np.empty_like(close) for _ in range(4))
+    compute_indicators(close, *outputs)
+    for out in outputs:
+        out.flags.writeable = False
+    return outputs
+
 
 class StockAnalyzer:
     def __init__(self, symbol: str, file_path: str):
@@ -13,14 +121,15 @@ class StockAnalyzer:
 
     def load_data(self):
         try:
-            self.df = pd.read_csv(self.file_path, parse_dates=['Date'])
+            # Only OHLCV is read; a missing column makes the read itself fail
+            self.df = read_csv_cached(
+                self.file_path,
+                parse_dates=['Date'],
+                usecols=['Date'] + PRICE_COLUMNS,
+                dtype={col: 'float32' for col in PRICE_COLUMNS if col != 'Volume'}
+            )
             self.df.sort_values('Date', inplace=True)
             self.df.reset_index(drop=True, inplace=True)
-            # Ensure columns exist
-            required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            for col in required_columns:
-                if col not in self.df.columns:
-                    raise ValueError(f"Missing required column: {col}")
             return True
         except Exception as e:
             print(f"[{self.symbol}] Error loading data: {e}")
@@ -28,11 +137,13 @@ class StockAnalyzer:
 
     def calculate_indicators(self):
         try:
-            self.df['SMA_20'] = talib.SMA(self.df['Close'], timeperiod=20)
-            self.df['RSI_14'] = talib.RSI(self.df['Close'], timeperiod=14)
-            macd, macd_signal, _ = talib.MACD(self.df['Close'], fastperiod=12, slowperiod=26, signalperiod=9)
-            self.df['MACD'] = macd
-            self.df['MACD_Signal'] = macd_signal
+            close = np.ascontiguousarray(self.df['Close'].to_numpy(dtype=np.float64))
+            sma, rsi, macd, macd_signal = _cached_indicators(self.symbol, close.tobytes())
+            # Copy out of the cache so later edits to the frame cannot corrupt it
+            self.df['SMA_20'] = sma.copy()
+            self.df['RSI_14'] = rsi.copy()
+            self.df['MACD'] = macd.copy()
+            self.df['MACD_Signal'] = macd_signal.copy()
         except Exception as e:
             print(f"[{self.symbol}] Error calculating indicators: {e}")
 
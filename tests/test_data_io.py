@@ -0,0 +1,74 @@
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.data_io import PARQUET_SUFFIX, read_csv_cached
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'prices.csv'
+    pd.DataFrame({
+        'Date': ['2020-01-02', '2020-01-03'],
+        'Open': [1.0, 2.0],
+        'Close': [123.456789012, 99.5]
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def fail_read_csv(*args, **kwargs):
+    raise AssertionError("CSV was re-parsed instead of using the Parquet cache")
+
+
+def test_subset_of_cached_columns_hits_cache(csv_path, monkeypatch):
+    read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Open', 'Close'])
+
+    monkeypatch.setattr(pd, 'read_csv', fail_read_csv)
+    df = read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Close'])
+    assert list(df.columns) == ['Date', 'Close']
+    assert pd.api.types.is_datetime64_any_dtype(df['Date'])
+
+
+def test_superset_of_cached_columns_reparses_and_rewrites_cache(csv_path):
+    read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Close'])
+    df = read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Open', 'Close'])
+
+    assert list(df['Open']) == [1.0, 2.0]
+    assert set(pq.read_schema(csv_path + PARQUET_SUFFIX).names) == {'Date', 'Open', 'Close'}
+
+
+def test_newer_csv_invalidates_cache(csv_path):
+    read_csv_cached(csv_path, parse_dates=['Date'])
+    pd.DataFrame({'Date': ['2020-01-06'], 'Open': [5.0], 'Close': [6.0]}).to_csv(csv_path, index=False)
+    cache_mtime = os.path.getmtime(csv_path + PARQUET_SUFFIX)
+    os.utime(csv_path, (cache_mtime + 10, cache_mtime + 10))
+
+    df = read_csv_cached(csv_path, parse_dates=['Date'])
+    assert list(df['Close']) == [6.0]
+
+
+def test_dtype_does_not_leak_between_callers(csv_path):
+    cast = read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Close'], dtype={'Close': 'float32'})
+    plain = read_csv_cached(csv_path, parse_dates=['Date'], usecols=['Date', 'Close'])
+
+    assert cast['Close'].dtype == 'float32'
+    assert plain['Close'].dtype == 'float64'
+    assert plain['Close'].iloc[0] == 123.456789012
+
+
+def test_parse_dates_mismatch_reparses(csv_path):
+    read_csv_cached(csv_path, parse_dates=['Date'])
+    df = read_csv_cached(csv_path)
+
+    assert not pd.api.types.is_datetime64_any_dtype(df['Date'])
+
+
+def test_blank_date_parses_to_nat(tmp_path):
+    path = tmp_path / 'gappy.csv'
+    path.write_text('Date,Close\n2020-01-02,1.5\n,2.0\n2020-01-06,3.0\n')
+
+    df = read_csv_cached(str(path), parse_dates=['Date'])
+    assert pd.api.types.is_datetime64_any_dtype(df['Date'])
+    assert df['Date'].isna().tolist() == [False, True, False]
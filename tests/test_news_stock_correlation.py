@@ -0,0 +1,141 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import pearsonr
+
+from src.news_stock_correlation import NewsStockCorrelation, score_headlines
+
+
+def make_analyzer(tmp_path):
+    # Trading days around the 2020-07-03 market holiday: Thu, (Fri closed), Mon, Tue, Wed
+    pd.DataFrame({
+        'Date': ['2020-07-02', '2020-07-06', '2020-07-07', '2020-07-08'],
+        'Close': [100.0, 110.0, 99.0, 99.0]
+    }).to_csv(tmp_path / 'stock.csv', index=False)
+    pd.DataFrame({
+        'headline': ['first day', 'holiday', 'weekend', 'late evening', 'midweek', 'after last day'],
+        'publisher': 'wire',
+        'date': [
+            '2020-07-02 10:00:00-04:00',  # first trading day: its return is NaN
+            '2020-07-03 09:00:00-04:00',  # holiday -> Mon 07-06
+            '2020-07-04 12:00:00-04:00',  # Saturday -> Mon 07-06
+            '2020-07-06 21:30:00-04:00',  # after 20:00 ET, already 07-07 in UTC -> stays on 07-06
+            '2020-07-08 15:00:00-04:00',
+            '2020-07-09 10:00:00-04:00',  # past the last trading day -> unaligned
+        ]
+    }).to_csv(tmp_path / 'news.csv', index=False)
+
+    analyzer = NewsStockCorrelation(str(tmp_path / 'news.csv'), str(tmp_path / 'stock.csv'), 'TEST')
+    assert analyzer.load_data()
+    return analyzer
+
+
+def test_align_dates_moves_news_to_next_trading_day(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    analyzer.align_dates()
+
+    aligned = pd.DatetimeIndex(analyzer.news_df['aligned_date'].astype('datetime64[ns]'))
+    expected = pd.DatetimeIndex(['2020-07-02', '2020-07-06', '2020-07-06', '2020-07-06', '2020-07-08', None])
+    pd.testing.assert_index_equal(aligned, expected, check_names=False)
+
+
+def test_calculate_daily_metrics_joins_sentiment_and_returns(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    analyzer.align_dates()
+    analyzer.news_df['sentiment'] = np.array([0.5, 0.2, -0.4, 1.0, -0.5, 0.9], dtype=np.float32)
+    analyzer.calculate_daily_metrics()
+
+    merged = analyzer.merged_df
+    # Thu 07-02 has a NaN return, Tue 07-07 has no news, 07-09 news has no trading day
+    assert list(merged.columns) == ['avg_sentiment', 'news_count', 'date_only', 'daily_return', 'Close']
+    assert list(merged.index) == [1, 3]
+    assert list(pd.to_datetime(merged['date_only'])) == [pd.Timestamp('2020-07-06'), pd.Timestamp('2020-07-08')]
+    assert list(merged['news_count']) == [3, 1]
+    np.testing.assert_allclose(merged['avg_sentiment'], [(0.2 - 0.4 + 1.0) / 3, -0.5], rtol=1e-6)
+    np.testing.assert_allclose(merged['daily_return'], [10.0, 0.0], atol=1e-4)
+    np.testing.assert_allclose(merged['Close'], [110.0, 99.0])
+
+
+def test_undated_stock_row_is_skipped(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    (tmp_path / 'stock.csv').write_text(
+        'Date,Close\n2020-07-02,100\n,105\n2020-07-06,110\n2020-07-07,99\n2020-07-08,99\n'
+    )
+    assert analyzer.load_data()
+    analyzer.align_dates()
+    analyzer.news_df['sentiment'] = np.array([0.5, 0.2, -0.4, 1.0, -0.5, 0.9], dtype=np.float32)
+    analyzer.calculate_daily_metrics()
+
+    # Returns stay positional, as with pct_change: 07-06 is measured against the undated row
+    merged = analyzer.merged_df
+    assert list(merged.index) == [2, 4]
+    np.testing.assert_allclose(merged['daily_return'], [110 / 105 * 100 - 100, 0.0], atol=1e-4)
+
+
+def correlation_of(sentiment, returns):
+    analyzer = NewsStockCorrelation('news.csv', 'stock.csv', 'TEST')
+    analyzer.merged_df = pd.DataFrame({
+        'avg_sentiment': np.asarray(sentiment, dtype=np.float32),
+        'daily_return': np.asarray(returns, dtype=np.float32)
+    })
+    return analyzer.calculate_correlation()
+
+
+@pytest.mark.parametrize('n', [3, 10, 500])
+def test_calculate_correlation_matches_pearsonr(n):
+    rng = np.random.default_rng(n)
+    sentiment = rng.uniform(-1, 1, n).astype(np.float32)
+    returns = (0.5 * sentiment + rng.normal(0, 1, n)).astype(np.float32)
+
+    corr, p_value = correlation_of(sentiment, returns)
+    expected = pearsonr(sentiment.astype(np.float64), returns.astype(np.float64))
+    np.testing.assert_allclose([corr, p_value], [expected.statistic, expected.pvalue], rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize('sentiment, returns', [
+    ([0.1, 0.4], [1.0, -2.0]),
+    ([0.4, 0.1], [-2.0, 1.0]),
+    ([0.2, 0.2], [1.0, -2.0]),
+    ([0.3, 0.3, 0.3], [1.0, -2.0, 0.5]),
+])
+def test_calculate_correlation_edge_cases_match_pearsonr(sentiment, returns):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = pearsonr(sentiment, returns)
+    np.testing.assert_equal(correlation_of(sentiment, returns), (expected.statistic, expected.pvalue))
+
+
+def test_calculate_correlation_needs_two_observations():
+    with pytest.raises(ValueError):
+        correlation_of([0.1], [1.0])
+
+
+def test_parallel_sentiment_matches_serial():
+    words = ['surge', 'plunge', 'great', 'fear', 'stock', 'earnings', 'loss', 'win']
+    rng = np.random.default_rng(0)
+    headlines = [' '.join(rng.choice(words, 6)) for _ in range(500)]
+
+    scores = {}
+    for n_jobs in (1, 2):
+        analyzer = NewsStockCorrelation('news.csv', 'stock.csv', 'TEST')
+        analyzer.news_df = pd.DataFrame({'headline': headlines})
+        analyzer.analyze_sentiment(n_jobs=n_jobs)
+        scores[n_jobs] = analyzer.news_df['sentiment'].to_numpy()
+    np.testing.assert_array_equal(scores[1], scores[2])
+
+
+def test_score_headlines_pins_lexicon_scores():
+    headlines = pd.Series([
+        'Apple shares surge on great earnings',
+        'Stock plunges as fears of crisis grow',
+        'Tesla to report quarterly results',
+        'Outlook is not good',  # no negation handling: scores as "good"
+        None,
+    ])
+    scores = score_headlines(headlines)
+
+    assert scores.dtype == np.float32
+    assert ((scores >= -1) & (scores <= 1)).all()
+    np.testing.assert_allclose(scores, [0.743038, -0.784527, 0.0, 0.440434, 0.0], atol=1e-6)
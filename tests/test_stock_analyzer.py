@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import talib
+
+from src.stock_analyzer import (
+    MACD_FAST, MACD_SIGNAL, MACD_SLOW, RSI_PERIOD, SMA_PERIOD, compute_indicators
+)
+
+
+def run_kernel(close):
+    outputs = tuple(np.empty_like(close) for _ in range(4))
+    compute_indicators(close, *outputs)
+    return outputs
+
+
+def talib_reference(close):
+    macd, macd_signal, _ = talib.MACD(
+        close, fastperiod=MACD_FAST, slowperiod=MACD_SLOW, signalperiod=MACD_SIGNAL
+    )
+    return (
+        talib.SMA(close, timeperiod=SMA_PERIOD),
+        talib.RSI(close, timeperiod=RSI_PERIOD),
+        macd,
+        macd_signal,
+    )
+
+
+def assert_matches_talib(close):
+    for name, got, expected in zip(
+        ['SMA', 'RSI', 'MACD', 'MACD_Signal'], run_kernel(close), talib_reference(close)
+    ):
+        np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize('n', [0, 1, 5, 20, 33, 34, 40, 1000])
+def test_indicators_match_talib_on_random_walk(n):
+    rng = np.random.default_rng(n)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    assert_matches_talib(close)
+
+
+def test_indicators_match_talib_on_flat_prices():
+    assert_matches_talib(np.full(100, 42.0))
+
+
+def test_indicators_match_talib_with_nan_gap():
+    close = 100 + np.random.default_rng(0).normal(0, 1, 200).cumsum()
+    close[50:55] = np.nan
+    sma, rsi, macd, macd_signal = run_kernel(close)
+    ref_sma, ref_rsi, ref_macd, ref_signal = talib_reference(close)
+
+    for name, got, ref in [('SMA', sma, ref_sma), ('MACD', macd, ref_macd), ('MACD_Signal', macd_signal, ref_signal)]:
+        np.testing.assert_allclose(got, ref, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name)
+
+    # RSI agrees up to the gap; after it the kernel follows TA-Lib 0.4.0 (the C library CI builds)
+    # and stays NaN, while newer TA-Lib C releases report 0 instead
+    np.testing.assert_allclose(rsi[:50], ref_rsi[:50], rtol=1e-9, atol=1e-9, equal_nan=True)
+    assert np.isnan(rsi[50:]).all()